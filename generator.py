@@ -1,288 +1,360 @@
+import heapq
+import importlib.util
 import random
 import logging
-import sys
+from array import array
 from datetime import datetime, timedelta
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
 from openpyxl.utils import get_column_letter
 
 # Set up logging
 log_filename = "shift_scheduler.log"
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler(sys.stdout)
+        logging.FileHandler(log_filename)
     ]
 )
+logger = logging.getLogger("shift_scheduler")
 
-# Redirect stdout and stderr to logging
-class LoggingStreamHandler:
-    def __init__(self, level):
-        self.level = level
+# openpyxl serialises through lxml when it is installed, which makes export_to_excel faster
+if importlib.util.find_spec("lxml") is None:
+    logger.info("Install lxml for faster XLSX export")
 
-    def write(self, message):
-        if message.strip() != "":
-            self.level(message.strip())
+SLOTS_PER_DAY = 4
 
-    def flush(self):
-        pass
-
-sys.stdout = LoggingStreamHandler(logging.info)
-sys.stderr = LoggingStreamHandler(logging.error)
+# Excel styles are immutable, so one shared instance serves every cell
+HEADER_FILL = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+CENTER = Alignment(horizontal="center")
+BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
 
 def rotate_list(lst, n):
     """Rotate a list by n positions."""
     return lst[n:] + lst[:n]
 
+def _equalize_core(shifts, slots_per_day, days_by_name, total, special, week_counts, special_mask,
+                   target_shifts, target_special_days, shifts_per_week, max_iterations):
+    """Swap over-target assignees for under-target ones in place; return the iterations used."""
+    name_ids = range(len(total))
+    choice = random.choice
+    # Only people below a target can take over a shift, so candidates are drawn
+    # from these pools rather than from every name.
+    under_total = {n for n in name_ids if total[n] < target_shifts}
+    under_special = {n for n in name_ids if special[n] < target_special_days}
+    iterations = 0
+    while iterations < max_iterations:
+        if max(total) - min(total) <= 1 and max(special) - min(special) <= 1:
+            break
+        if not under_total and not under_special:
+            break
+
+        swapped = False
+        for day, is_special in enumerate(special_mask):
+            first_slot = day * slots_per_day
+            week_number = day // 7
+
+            for slot in range(first_slot, first_slot + slots_per_day):
+                name_id = shifts[slot]
+                if (total[name_id] > target_shifts or
+                    (is_special and special[name_id] > target_special_days)):
+
+                    pool = under_total | under_special if is_special else under_total
+                    if not pool:
+                        continue
+
+                    current_assignees = shifts[first_slot:first_slot + slots_per_day]
+                    candidates = [n for n in sorted(pool)
+                                  if n not in current_assignees
+                                  and (day - 1) not in days_by_name[n]
+                                  and (day + 1) not in days_by_name[n]
+                                  and week_counts[n][week_number] < shifts_per_week]
+
+                    if candidates:
+                        replacement = choice(candidates)
+                        shifts[slot] = replacement
+                        swapped = True
+                        days_by_name[name_id].discard(day)
+                        days_by_name[replacement].add(day)
+                        total[name_id] -= 1
+                        total[replacement] += 1
+                        if is_special:
+                            special[name_id] -= 1
+                            special[replacement] += 1
+                        week_counts[name_id][week_number] -= 1
+                        week_counts[replacement][week_number] += 1
+                        for n in (name_id, replacement):
+                            if total[n] < target_shifts:
+                                under_total.add(n)
+                            else:
+                                under_total.discard(n)
+                            if special[n] < target_special_days:
+                                under_special.add(n)
+                            else:
+                                under_special.discard(n)
+                        if max(total) - min(total) <= 1 and max(special) - min(special) <= 1:
+                            return iterations + 1  # balanced part-way through this sweep
+
+        iterations += 1
+        # A sweep without swaps leaves the state unchanged, so every later sweep would too.
+        if not swapped:
+            break
+    return iterations
+
 class ShiftScheduler:
     def __init__(self, start_date, end_date, names, holidays):
         self.start_date = start_date
         self.end_date = end_date
         self.names = names
-        self.holidays = holidays
-        self.schedule = {}
-        self.assignments = {name: {'total': 0, 'special_days': 0, 'dates': [], 'last_assigned': None, 'weeks': {}} for name in names}
+        self.holidays = frozenset(holidays)
+        self._dates = [self.start_date + timedelta(days=i) for i in range((self.end_date - self.start_date).days + 1)]
+        self._day_of = {date: i for i, date in enumerate(self._dates)}
+        self._fmt_cache = {}
+        self._name_id = {name: i for i, name in enumerate(names)}
+        self._n_weeks = (len(self._dates) + 6) // 7
+
+        self._reset_state()
+
+        self._special_by_offset = self._calculate_special_mask()
         self.special_days = self.calculate_special_days()
-        self.total_shifts = ((self.end_date - self.start_date).days + 1) * 4
+        self._special_set = frozenset(self.special_days)
+        self.total_shifts = ((self.end_date - self.start_date).days + 1) * SLOTS_PER_DAY
         self.total_weeks = ((self.end_date - self.start_date).days + 1) // 7
-        self.shifts_per_week = (4 * self.total_weeks) // len(self.names)
+        self.shifts_per_week = (SLOTS_PER_DAY * self.total_weeks) // len(self.names)
+        self.target_shifts = self.total_shifts // len(self.names)
+        self.target_special_days = len(self.special_days) * SLOTS_PER_DAY // len(self.names)
+
+    def _reset_state(self):
+        # Hot-path state is kept as parallel lists indexed by name ID and day offset and is
+        # updated incrementally; `schedule` and `assignments` are name/date keyed views of it.
+        # Slot SLOTS_PER_DAY * day + i holds a name ID; 'H' covers rosters of up to 65536 people.
+        self._shifts = array('H', [0]) * (SLOTS_PER_DAY * len(self._dates))
+        self._days_by_name = [set() for _ in self.names]
+        self._total = [0] * len(self.names)
+        self._special = [0] * len(self.names)
+        self._week_counts = [[0] * self._n_weeks for _ in self.names]
+
+    @property
+    def schedule(self):
+        return {date: [self.names[i] for i in self._shift_ids(day)] for day, date in enumerate(self._dates)}
+
+    @property
+    def assignments(self):
+        """Per-person stats keyed by name; 'dates' is already in calendar order."""
+        assignments = {}
+        for name, name_id in self._name_id.items():
+            days = sorted(self._days_by_name[name_id])
+            assignments[name] = {
+                'total': self._total[name_id],
+                'special_days': self._special[name_id],
+                'dates': [self._dates[day] for day in days],
+                'last_assigned': self._dates[days[-1]] if days else None,
+                'weeks': {week: count for week, count in enumerate(self._week_counts[name_id]) if count},
+            }
+        return assignments
+
+    def _calculate_special_mask(self):
+        start_weekday = self.start_date.weekday()
+        special_mask = [(day + start_weekday) % 7 >= 5 for day in range(len(self._dates))]
+        for holiday in self.holidays:
+            day = self._day_of.get(holiday)
+            if day is not None:
+                special_mask[day] = True
+        return special_mask
 
     def calculate_special_days(self):
-        special_days = []
-        current_date = self.start_date
-        while current_date <= self.end_date:
-            if current_date.weekday() >= 5 or current_date in self.holidays:
-                special_days.append(current_date)
-            current_date += timedelta(days=1)
-        return special_days
+        return [date for date, is_special in zip(self._dates, self._special_by_offset) if is_special]
 
     def is_special_day(self, date):
-        return date.weekday() >= 5 or date in self.holidays
+        return date in self._special_set
 
     def get_week_number(self, date):
-        return (date - self.start_date).days // 7
+        return self._day_of[date] // 7
 
     def is_available(self, name, date):
-        week_number = self.get_week_number(date)
-        return self.assignments[name]['weeks'].get(week_number, 0) < self.shifts_per_week
+        return self._week_counts[self._name_id[name]][self._day_of[date] // 7] < self.shifts_per_week
 
     def is_consecutive(self, name, date):
-        prev_day = date - timedelta(days=1)
-        next_day = date + timedelta(days=1)
-        return (prev_day in self.schedule and name in self.schedule[prev_day]) or \
-               (next_day in self.schedule and name in self.schedule[next_day])
+        day = self._day_of[date]
+        assigned = self._days_by_name[self._name_id[name]]
+        return (day - 1) in assigned or (day + 1) in assigned
+
+    def _formatted_dates(self, fmt):
+        """Map every date in range to its strftime(fmt) string, formatting each date only once."""
+        if fmt not in self._fmt_cache:
+            self._fmt_cache[fmt] = {date: date.strftime(fmt) for date in self._dates}
+        return self._fmt_cache[fmt]
+
+    def _shift_ids(self, day):
+        return self._shifts[SLOTS_PER_DAY * day:SLOTS_PER_DAY * (day + 1)]
 
     def generate_schedule(self):
-        logging.info("Generating initial schedule...")
-        dates = [self.start_date + timedelta(days=i) for i in range((self.end_date - self.start_date).days + 1)]
-        
-        for current_date in dates:
-            available_names = [name for name in self.names if not self.is_consecutive(name, current_date) and self.is_available(name, current_date)]
-            if len(available_names) < 4:
-                logging.warning(f"Not enough available names for date {current_date}. Attempting to relax constraints.")
-                available_names = [name for name in self.names if not self.is_consecutive(name, current_date)]
-
-            random.shuffle(available_names)
-
-            shift = []
-            for _ in range(4):  # Assign 4 people per day
-                if not available_names:
-                    logging.warning(f"No available names for date {current_date}. Choosing from all names.")
-                    available_names = [name for name in self.names if name not in shift]
-                    random.shuffle(available_names)
-
-                name = available_names.pop(0)
-                shift.append(name)
-                week_number = self.get_week_number(current_date)
-                self.assignments[name]['weeks'][week_number] = self.assignments[name]['weeks'].get(week_number, 0) + 1
-
-            self.schedule[current_date] = shift
-
-        logging.info("Initial schedule generated. Starting balancing process...")
-        self.update_assignments()
+        logger.info("Generating initial schedule...")
+        self._reset_state()
+        name_ids = range(len(self.names))
+        total = self._total
+        special = self._special
+        week_counts = self._week_counts
+        previous_assignees = ()
+        for day, current_date in enumerate(self._dates):
+            is_special = self._special_by_offset[day]
+            week_number = day // 7
+            # Days are filled in order, so only the previous day's assignees can clash.
+            not_consecutive = [i for i in name_ids if i not in previous_assignees]
+            available_ids = [i for i in not_consecutive if week_counts[i][week_number] < self.shifts_per_week]
+            if len(available_ids) < SLOTS_PER_DAY:
+                logger.warning(f"Not enough available names for date {current_date}. Attempting to relax constraints.")
+                available_ids = not_consecutive
+
+            # Least-loaded people first; the random component breaks ties.
+            heap = [(total[i], special[i], random.random(), i) for i in available_ids]
+            heapq.heapify(heap)
+
+            first_slot = SLOTS_PER_DAY * day
+            for slot in range(first_slot, first_slot + SLOTS_PER_DAY):
+                if not heap:
+                    logger.warning(f"No available names for date {current_date}. Choosing from all names.")
+                    assigned = self._shifts[first_slot:slot]
+                    heap = [(total[i], special[i], random.random(), i) for i in name_ids if i not in assigned]
+                    heapq.heapify(heap)
+
+                name_id = heapq.heappop(heap)[3]
+                self._shifts[slot] = name_id
+                self._days_by_name[name_id].add(day)
+                week_counts[name_id][week_number] += 1
+                total[name_id] += 1
+                if is_special:
+                    special[name_id] += 1
+
+            previous_assignees = self._shifts[first_slot:first_slot + SLOTS_PER_DAY]
+
+        logger.info("Initial schedule generated. Starting balancing process...")
+        assert self._counters_match_schedule(), "Counters out of sync after initial schedule"
         self.equalize_shifts()
-        logging.info("Schedule generation and balancing completed.")
+        logger.info("Schedule generation and balancing completed.")
 
     def equalize_shifts(self, max_iterations=2000):
-        logging.info("Starting to equalize shifts...")
-        target_shifts = self.total_shifts // len(self.names)
-        target_special_days = len(self.special_days) * 4 // len(self.names)
-
-        logging.info(f"Target shifts per person: {target_shifts}")
-        logging.info(f"Target special days per person: {target_special_days}")
-
-        iterations = 0
-        while iterations < max_iterations:
-            max_total = max(person['total'] for person in self.assignments.values())
-            min_total = min(person['total'] for person in self.assignments.values())
-            max_special = max(person['special_days'] for person in self.assignments.values())
-            min_special = min(person['special_days'] for person in self.assignments.values())
-
-            if max_total - min_total <= 1 and max_special - min_special <= 1:
-                break
-
-            for date in sorted(self.schedule.keys()):
-                current_assignees = self.schedule[date]
-                is_special = self.is_special_day(date)
-
-                for i, name in enumerate(current_assignees):
-                    if (self.assignments[name]['total'] > target_shifts or 
-                        (is_special and self.assignments[name]['special_days'] > target_special_days)):
-                        
-                        candidates = [n for n in self.names 
-                                      if n not in current_assignees 
-                                      and not self.is_consecutive(n, date)
-                                      and self.is_available(n, date)
-                                      and (self.assignments[n]['total'] < target_shifts or
-                                           (is_special and self.assignments[n]['special_days'] < target_special_days))]
-                        
-                        if candidates:
-                            replacement = random.choice(candidates)
-                            self.schedule[date][i] = replacement
-                            self.assignments[name]['total'] -= 1
-                            self.assignments[name]['dates'].remove(date)
-                            self.assignments[replacement]['total'] += 1
-                            self.assignments[replacement]['dates'].append(date)
-                            if is_special:
-                                self.assignments[name]['special_days'] -= 1
-                                self.assignments[replacement]['special_days'] += 1
-                            
-                            # Update weeks
-                            week_number = self.get_week_number(date)
-                            self.assignments[name]['weeks'][week_number] -= 1
-                            self.assignments[replacement]['weeks'][week_number] = self.assignments[replacement]['weeks'].get(week_number, 0) + 1
-
-            iterations += 1
-
-        logging.info(f"Finished equalizing shifts after {iterations} iterations.")
-        self.update_assignments()
-
-    def update_assignments(self):
-        for name in self.names:
-            self.assignments[name]['total'] = 0
-            self.assignments[name]['special_days'] = 0
-            self.assignments[name]['dates'] = []
-            self.assignments[name]['last_assigned'] = None
-            self.assignments[name]['weeks'] = {}
-
-        for date, assignees in self.schedule.items():
-            for name in assignees:
-                self.assignments[name]['total'] += 1
-                self.assignments[name]['dates'].append(date)
-                if self.is_special_day(date):
-                    self.assignments[name]['special_days'] += 1
-                if self.assignments[name]['last_assigned'] is None or date > self.assignments[name]['last_assigned']:
-                    self.assignments[name]['last_assigned'] = date
-                week_number = self.get_week_number(date)
-                self.assignments[name]['weeks'][week_number] = self.assignments[name]['weeks'].get(week_number, 0) + 1
+        logger.info("Starting to equalize shifts...")
+        logger.info(f"Target shifts per person: {self.target_shifts}")
+        logger.info(f"Target special days per person: {self.target_special_days}")
+
+        iterations = _equalize_core(self._shifts, SLOTS_PER_DAY, self._days_by_name, self._total, self._special,
+                                    self._week_counts, self._special_by_offset, self.target_shifts,
+                                    self.target_special_days, self.shifts_per_week, max_iterations)
+
+        logger.info(f"Finished equalizing shifts after {iterations} iterations.")
+        assert self._counters_match_schedule(), "Counters out of sync after balancing"
+
+    def _counters_match_schedule(self):
+        """Recount every counter from the schedule and check it matches the incrementally kept one."""
+        total = [0] * len(self.names)
+        special = [0] * len(self.names)
+        week_counts = [[0] * self._n_weeks for _ in self.names]
+        days_by_name = [set() for _ in self.names]
+
+        for day, is_special in enumerate(self._special_by_offset):
+            for name_id in self._shift_ids(day):
+                total[name_id] += 1
+                days_by_name[name_id].add(day)
+                if is_special:
+                    special[name_id] += 1
+                week_counts[name_id][day // 7] += 1
+
+        return (total == self._total and special == self._special and
+                week_counts == self._week_counts and days_by_name == self._days_by_name)
 
     def print_schedule(self):
-        print("Schedule by Date:")
-        for date, shift in sorted(self.schedule.items()):
-            print(f"{date.strftime('%Y-%m-%d')}: {', '.join(shift)}")
+        fmt = self._formatted_dates('%Y-%m-%d')
+        lines = ["Schedule by Date:"]
+        for day, date in enumerate(self._dates):
+            lines.append(f"{fmt[date]}: {', '.join(self.names[i] for i in self._shift_ids(day))}")
+        logger.info("\n".join(lines))
 
     def print_personal_schedules(self):
-        print("\nSchedule by Person:")
+        fmt = self._formatted_dates('%Y-%m-%d')
+        lines = ["Schedule by Person:"]
         for name, stats in self.assignments.items():
-            dates = ', '.join(date.strftime('%Y-%m-%d') for date in sorted(stats['dates']))
-            print(f"{name}: {dates}")
+            dates = ', '.join(fmt[date] for date in stats['dates'])
+            lines.append(f"{name}: {dates}")
+        logger.info("\n".join(lines))
 
     def print_statistics(self):
-        print("\nAssignment Statistics:")
+        lines = ["Assignment Statistics:"]
         for name, stats in self.assignments.items():
-            print(f"{name}: Total: {stats['total']}, Special Days: {stats['special_days']}, Weeks: {len(stats['weeks'])}")
+            lines.append(f"{name}: Total: {stats['total']}, Special Days: {stats['special_days']}, Weeks: {len(stats['weeks'])}")
 
-        print("\nOverall Statistics:")
-        print(f"Total number of standbys: {self.total_shifts}")
-        print(f"Total number of Special Days: {len(self.special_days)}")
-        print(f"Shifts per week per person: {self.shifts_per_week}")
+        lines.append("")
+        lines.append("Overall Statistics:")
+        lines.append(f"Total number of standbys: {self.total_shifts}")
+        lines.append(f"Total number of Special Days: {len(self.special_days)}")
+        lines.append(f"Shifts per week per person: {self.shifts_per_week}")
+        logger.info("\n".join(lines))
 
     def export_to_excel(self, filename):
-        wb = Workbook()
-
-        # Shift Schedule sheet
-        ws = wb.active
-        ws.title = "Shift Schedule"
-        header_fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-
-        # Headers
-        ws['A1'] = "Date"
-        ws['B1'] = "Day"
-        ws['C1'] = "Person 1"
-        ws['D1'] = "Person 2"
-        ws['E1'] = "Person 3"
-        ws['F1'] = "Person 4"
-        ws['G1'] = "Special Day"
-        for cell in ws[1]:
-            cell.fill = header_fill
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.alignment = Alignment(horizontal="center")
-
-        # Data for shift schedule
-        for row, (date, shift) in enumerate(sorted(self.schedule.items()), start=2):
-            ws.cell(row=row, column=1, value=date.strftime("%d/%m/%Y"))
-            ws.cell(row=row, column=2, value=date.strftime("%A"))  # Add day of the week
-            for col, name in enumerate(shift, start=3):
-                cell = ws.cell(row=row, column=col, value=name)
-                cell.border = border
-                cell.alignment = Alignment(horizontal="center")
-            ws.cell(row=row, column=7, value="Yes" if self.is_special_day(date) else "No")
-            ws.cell(row=row, column=7).border = border
-            ws.cell(row=row, column=7).alignment = Alignment(horizontal="center")
-
-        # Adjust column widths for shift schedule
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        wb = Workbook(write_only=True)
+
+        # Write-only sheets cannot be revisited, so widths must be set before the
+        # first row is appended.
+        def track_widths(widths, values):
+            for i, value in enumerate(values):
+                widths[i] = max(widths[i], len(str(value)))
+            return values
+
+        def set_column_widths(ws, widths):
+            for col, width in enumerate(widths, start=1):
+                ws.column_dimensions[get_column_letter(col)].width = width + 2
+
+        def header_cells(ws, headers):
+            cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.fill = HEADER_FILL
+                cell.font = HEADER_FONT
+                cell.alignment = CENTER
+                cells.append(cell)
+            return cells
+
+        fmt = self._formatted_dates("%d/%m/%Y")
+
+        # Shift Schedule sheet: one row per date, so its widths are derived from the
+        # inputs up front and the rows are streamed without being buffered.
+        ws = wb.create_sheet("Shift Schedule")
+        headers = ["Date", "Day"] + [f"Person {i}" for i in range(1, SLOTS_PER_DAY + 1)] + ["Special Day"]
+        day_names = [date.strftime("%A") for date in self._dates[:7]]
+        value_widths = ([len(self.start_date.strftime("%d/%m/%Y")), max(map(len, day_names), default=0)]
+                        + [max(map(len, self.names))] * SLOTS_PER_DAY + [len("Yes")])
+        set_column_widths(ws, [max(len(header), width) for header, width in zip(headers, value_widths)])
+        ws.append(header_cells(ws, headers))
+        for day, is_special in enumerate(self._special_by_offset):
+            row_cells = [fmt[self._dates[day]], day_names[day % 7]]  # Add day of the week
+            for value in [self.names[name_id] for name_id in self._shift_ids(day)] + ["Yes" if is_special else "No"]:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.border = BORDER
+                cell.alignment = CENTER
+                row_cells.append(cell)
+            ws.append(row_cells)
 
         # Personal Schedules sheet
         ws2 = wb.create_sheet("Personal Schedules")
-
-        # Headers
-        ws2['A1'] = "Person"
-        ws2['B1'] = "Dates"
-        ws2['C1'] = "Total Shifts"
-        ws2['D1'] = "Special Days"
-        ws2['E1'] = "Weeks"
-        for cell in ws2[1]:
-            cell.fill = header_fill
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.alignment = Alignment(horizontal="center")
-
-        # Data for personal schedules
-        for row, (name, stats) in enumerate(self.assignments.items(), start=2):
-            ws2.cell(row=row, column=1, value=name)
-            ws2.cell(row=row, column=2, value=", ".join(date.strftime("%d/%m/%Y") for date in sorted(stats['dates'])))
-            ws2.cell(row=row, column=3, value=stats['total'])
-            ws2.cell(row=row, column=4, value=stats['special_days'])
-            ws2.cell(row=row, column=5, value=len(stats['weeks']))
-
-        # Adjust column widths for personal schedules
-        for column in ws2.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(cell.value)
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            ws2.column_dimensions[column_letter].width = adjusted_width
+        headers = ["Person", "Dates", "Total Shifts", "Special Days", "Weeks"]
+        widths = [len(header) for header in headers]
+        rows = []
+        for name, stats in self.assignments.items():
+            rows.append(track_widths(widths, [name,
+                         ", ".join(fmt[date] for date in stats['dates']),
+                         stats['total'],
+                         stats['special_days'],
+                         len(stats['weeks'])]))
+        set_column_widths(ws2, widths)
+        ws2.append(header_cells(ws2, headers))
+        for values in rows:
+            ws2.append(values)
 
         wb.save(filename)
-        logging.info(f"Exported schedule to {filename}")
+        logger.info(f"Exported schedule to {filename}")
 
 # Usage example
 start_date = datetime(2024, 9, 28)
@@ -293,7 +365,7 @@ holidays = [datetime(2024, 10, 30), datetime(2024, 10, 31), datetime(2024, 12, 3
 # Rotate the list of names by a random number
 rotation = random.randint(0, len(names) - 1)
 rotated_names = rotate_list(names, rotation)
-logging.info(f"Names rotated by {rotation} positions: {rotated_names}")
+logger.info(f"Names rotated by {rotation} positions: {rotated_names}")
 
 scheduler = ShiftScheduler(start_date, end_date, rotated_names, holidays)
 scheduler.generate_schedule()